@@ -1,23 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Tuple, Union
+
 import requests
-import base64
+from requests.adapters import HTTPAdapter
+
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64  # type: ignore[no-redef]
 
 
 class Client:
-    def __init__(self, api_key: str, host: str = None):
+    def __init__(self, api_key: str, host: Optional[str] = None, pool_size: int = 64):
         self._api_key = api_key
         self._host = host if host else 'https://api.production.event-dripper.haps.pw'
+        self._pool_size = pool_size
         self._requests = requests.Session()
+        self._requests.headers['Authorization'] = api_key
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._requests.mount('https://', adapter)
+        self._requests.mount('http://', adapter)
+
+    def add_event(self, entity_id: str, event_name: str, data: Union[str, bytes]):
+        if isinstance(data, str):
+            data = data.encode('utf8')
 
-    def add_event(self, entity_id: str, event_name: str, data: str):
         payload = {
             'entity_id': entity_id,
             'event_name': event_name,
-            'data': base64.b64encode(data.encode('utf8')).decode('utf8'),
+            'data': base64.b64encode(data).decode('ascii'),
         }
 
-        headers = {
-            'Authorization': self._api_key
-        }
-
-        r = self._requests.post(f'{self._host}/api/event', json=payload, headers=headers)
+        r = self._requests.post(f'{self._host}/api/event', json=payload)
         r.raise_for_status()
+
+    def add_events(self, events: Iterable[Tuple[str, str, Union[str, bytes]]]):
+        # Events are posted concurrently, one worker per pooled connection.
+        with ThreadPoolExecutor(max_workers=self._pool_size) as executor:
+            futures = [executor.submit(self.add_event, *event) for event in events]
+
+        for future in futures:
+            future.result()
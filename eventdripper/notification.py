@@ -5,13 +5,17 @@ from dataclasses import dataclass
 
 @dataclass
 class Event:
-    at: datetime.datetime = datetime.datetime
-    name: str = str
-    data: ByteString = None
+    __slots__ = ('at', 'name', 'data')
+
+    at: datetime.datetime
+    name: str
+    data: ByteString
 
 
 @dataclass
 class Notification:
+    __slots__ = ('trigger_name', 'entity_id', 'events')
+
     trigger_name: str
     entity_id: str
-    events: Sequence[Event] = list
+    events: Sequence[Event]
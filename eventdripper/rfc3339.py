@@ -105,6 +105,7 @@ __all__ = [
     'UTC_TZ',
     'parse_date',
     'parse_datetime',
+    'parse_datetime_batch',
     'parse_time',
     'now',
     'utcfromtimestamp',
@@ -166,6 +167,8 @@ def make_re(*parts):
 date_re = make_re(date_re_str)
 datetime_re = make_re(date_re_str, r'[ tT]', time_re_str)
 time_re = make_re(time_re_str)
+utc_datetime_re = re.compile(
+    r'(\d\d\d\d)-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?Z')
 
 
 def parse_date(s):
@@ -400,6 +403,38 @@ def parse_datetime(s):
         raise ValueError('Invalid RFC 3339 datetime string', s)
 
 
+def parse_datetime_batch(strings):
+    """
+    Parses each of the given 'date-time' strings as parse_datetime
+    does, returning a list of datetime.datetime instances.
+
+    Strings in the common UTC form (upper case 'T' and 'Z', no
+    surrounding whitespace, at most microsecond precision) are parsed
+    on a fast path; everything else is handed to parse_datetime.
+
+    >>> parse_datetime_batch(["2008-08-24T00:00:11.25Z", "2008-08-24T00:00:00+01:00"])
+    [datetime.datetime(2008, 8, 24, 0, 0, 11, 250000, tzinfo=rfc3339.UTC_TZ), datetime.datetime(2008, 8, 24, 0, 0, tzinfo=rfc3339.tzinfo(60,'+01:00'))]
+    >>> parse_datetime_batch(["2008-08-24T00:00:00"])
+    Traceback (most recent call last):
+      File "<stdin>", line 1, in <module>
+      File "rfc3339.py", line 208, in parse_datetime
+        raise ValueError('Invalid RFC 3339 datetime string', s)
+    ValueError: ('Invalid RFC 3339 datetime string', '2008-08-24T00:00:00')
+    """
+    datetimes = []
+    for s in strings:
+        m = utc_datetime_re.fullmatch(s)
+        if m:
+            (y, m, d, hour, min, sec, frac_sec) = m.groups()
+            microsec = int(frac_sec.ljust(6, '0')) if frac_sec else 0
+            datetimes.append(datetime.datetime(
+                int(y), int(m), int(d), int(hour), int(min), int(sec), microsec, UTC_TZ))
+        else:
+            datetimes.append(parse_datetime(s))
+
+    return datetimes
+
+
 def now():
     """Return a timezone-aware datetime.datetime object in
     rfc3339.UTC_TZ timezone, representing the current moment
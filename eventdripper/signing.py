@@ -1,45 +1,80 @@
-from dataclasses import dataclass
-import base64
+from functools import lru_cache
 import hmac
-import json
+import re
 import time
-from hashlib import sha256
-from typing import ByteString
+from typing import Any, List, NamedTuple, Optional, Union
+
+try:
+    import orjson as json
+except ImportError:
+    import json  # type: ignore[no-redef]
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None  # type: ignore[assignment]
+
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64  # type: ignore[no-redef]
 
 from eventdripper.notification import Notification, Event
 from eventdripper.exceptions import InvalidHeaderError, SignatureExpiredError, InvalidSignatureError, InvalidPayloadFormatError
-from eventdripper.rfc3339 import parse_datetime
+from eventdripper.rfc3339 import parse_datetime_batch
 
 SigningVersion = 'v1'
+SigningDigest = 'sha256'
 SigningToleranceSeconds = 300
 
+_signature_re = re.compile(r'[0-9a-f]{64}')
+
+
+def construct_notification(payload: Union[str, bytes], header: str, secret: str) -> Notification:
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
 
-def construct_notification(payload: str, header: str, secret: str) -> Notification:
     signed_header = _parse_header(header)
 
     if SigningToleranceSeconds and signed_header.timestamp < time.time() - SigningToleranceSeconds:
         raise SignatureExpiredError
 
+    # Signatures that are not well-formed hex digests can never match, so
+    # skip them without computing the (comparatively expensive) HMAC.
+    got_signatures = [bytes.fromhex(s) for s in signed_header.signatures if _signature_re.fullmatch(s)]
+    if not got_signatures:
+        raise InvalidSignatureError
+
     expected_signature = _compute_signature(secret, signed_header.timestamp, payload)
 
-    for got_signatures in signed_header.signatures:
-        if hmac.compare_digest(expected_signature, got_signatures):
+    for got_signature in got_signatures:
+        if hmac.compare_digest(expected_signature, got_signature):
             return _build_notification(payload)
 
     raise InvalidSignatureError
 
 
-def _build_notification(payload: str) -> Notification:
+def _build_notification(payload: bytes) -> Notification:
+    notification_json: Any
     try:
-        notification_json = json.loads(payload)
+        if simdjson:
+            # simdjson only materializes the values that are read. Parsers
+            # can't be shared between threads, so use one per call.
+            notification_json = simdjson.Parser().parse(payload)
+        else:
+            notification_json = json.loads(payload)
+
+        events_json = notification_json['events']
+        events_at = parse_datetime_batch([event['at'] for event in events_json])
 
-        events = []
-        for event in notification_json['events']:
-            events.append(Event(
-                at=parse_datetime(event['at']),
+        events = [
+            Event(
+                at=at,
                 name=event['name'],
-                data=base64.b64decode(event['data']),
-            ))
+                data=base64.b64decode(event['data'], validate=True),
+            )
+            for event, at in zip(events_json, events_at)
+        ]
 
         return Notification(
             trigger_name=notification_json['trigger_name'],
@@ -50,45 +85,49 @@ def _build_notification(payload: str) -> Notification:
         raise InvalidPayloadFormatError(e)
 
 
-def _compute_signature(secret: ByteString, timestamp: int, payload: ByteString):
-    mac = hmac.new(
-        secret.encode("utf-8"),
-        msg=f'{timestamp}.{payload}'.encode("utf-8"),
-        digestmod=sha256,
-    )
-    return mac.hexdigest()
+def _compute_signature(secret: str, timestamp: int, payload: Union[str, bytes]) -> bytes:
+    mac = _keyed_mac(secret).copy()
+    mac.update(b'%d.' % timestamp)
+    mac.update(payload if isinstance(payload, bytes) else payload.encode("utf-8"))
+    return mac.digest()
+
+
+@lru_cache(maxsize=8)
+def _keyed_mac(secret: str) -> hmac.HMAC:
+    """ Returns an HMAC object keyed with secret, for callers to copy() and
+    update(). Caching it saves the key setup on each verification.
+    """
+    return hmac.new(secret.encode("utf-8"), digestmod=SigningDigest)
 
 
-@dataclass
-class SignedHeader:
-    timestamp: int = int
-    signatures: [] = list
+class SignedHeader(NamedTuple):
+    timestamp: int
+    signatures: List[str]
 
 
 def _parse_header(header: str) -> SignedHeader:
     if len(header) == 0:
         raise InvalidHeaderError('empty header')
 
-    signed_header = SignedHeader(timestamp=None, signatures=[])
+    timestamp: Optional[int] = None
+    signatures: List[str] = []
 
-    pairs = header.split(',')
-    for pair in pairs:
-        parts = pair.split('=')
-        if len(parts) != 2:
+    for pair in header.split(','):
+        key, sep, value = pair.partition('=')
+        if not sep or '=' in value:
             raise InvalidHeaderError('invalid format')
 
-        key, value = parts
         if key == 't':
             try:
-                signed_header.timestamp = int(value)
+                timestamp = int(value)
             except ValueError:
                 raise InvalidHeaderError('invalid timestamp format')
         elif key == SigningVersion:
-            signed_header.signatures.append(value)
+            signatures.append(value)
         else:
             pass
 
-    if len(signed_header.signatures) == 0 or signed_header.timestamp is None:
+    if len(signatures) == 0 or timestamp is None:
         raise InvalidHeaderError('missing fields')
 
-    return signed_header
+    return SignedHeader(timestamp, signatures)
@@ -44,7 +44,7 @@ class TestSigning(TestCase):
 
         for name, test in tests.items():
             got = _compute_signature(test.secret, test.timestamp, test.payload)
-            self.assertEqual(test.expected, got, name)
+            self.assertEqual(test.expected, got.hex(), name)
 
     def test_parse_header(self):
         """ Verifies that parse_header throws exceptions for invalid headers,
@@ -123,7 +123,7 @@ class TestSigning(TestCase):
         secret = 'top secret'
         timestamp = int(time.time())
         signature = _compute_signature(secret=secret, timestamp=timestamp, payload=payload)
-        header = f't={timestamp},v1={signature}'
+        header = f't={timestamp},v1={signature.hex()}'
 
         got_notification = construct_notification(payload=payload, header=header, secret=secret,)
         self.assertEqual(trigger_name, got_notification.trigger_name)
@@ -136,6 +136,22 @@ class TestSigning(TestCase):
             self.assertEqual(expected['name'], got.name)
             self.assertEqual(base64.b64decode(expected['data']), got.data)
 
+    def test_construct_notification_bytes_payload(self):
+        """ Verifies that a payload given as bytes is verified the same way as
+        when it is given as a str.
+        """
+
+        payload = '{"trigger_name":"trigger_now","entity_id":"michael","events":[{"at":"2020-10-09T13:47:17.321618Z","name":"trigger_now","data":"eW91d2luQHZiYW5nLmRr"}]}'
+
+        secret = 'top secret'
+        timestamp = int(time.time())
+        signature = _compute_signature(secret=secret, timestamp=timestamp, payload=payload)
+        header = f't={timestamp},v1={signature.hex()}'
+
+        from_str = construct_notification(payload=payload, header=header, secret=secret)
+        from_bytes = construct_notification(payload=payload.encode('utf8'), header=header, secret=secret)
+        self.assertEqual(from_str, from_bytes)
+
     def test_construct_notification_invalid_header_signature(self):
         """ Verifies that a header with an invalid signature raises the
         InvalidSignatureError.
@@ -191,7 +207,7 @@ class TestSigning(TestCase):
         timestamp = int(time.time())
         signature = _compute_signature(secret=secret, timestamp=timestamp, payload=payload)
 
-        header = f't={timestamp+10},v1={signature}'
+        header = f't={timestamp+10},v1={signature.hex()}'
 
         with self.assertRaises(InvalidSignatureError):
             construct_notification(payload=payload, header=header, secret=secret)
@@ -222,7 +238,7 @@ class TestSigning(TestCase):
         timestamp = int(133742)
         signature = _compute_signature(secret=secret, timestamp=timestamp, payload=payload)
 
-        header = f't={timestamp},v1={signature}'
+        header = f't={timestamp},v1={signature.hex()}'
 
         with self.assertRaises(SignatureExpiredError):
             construct_notification(payload=payload, header=header, secret=secret)